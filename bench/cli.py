@@ -18,7 +18,7 @@ from bench.utils import (
 	check_latest_version,
 	drop_privileges,
 	find_parent_bench,
-	get_env_frappe_commands,
+	generate_command_cache,
 	get_cmd_output,
 	is_bench_directory,
 	is_dist_editable,
@@ -203,7 +203,7 @@ def get_frappe_commands():
 	if not is_bench_directory():
 		return set()
 
-	return set(get_env_frappe_commands())
+	return set(generate_command_cache())
 
 
 def get_frappe_help(bench_path="."):
@@ -40,8 +40,20 @@ def get_common_site_config(bench_path):
 
 def put_config(config, bench_path="."):
 	config_path = get_config_path(bench_path)
-	with open(config_path, "w") as f:
-		return json.dump(config, f, indent=1, sort_keys=True)
+	tmp_path = config_path + ".tmp"
+
+	try:
+		import orjson
+
+		payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+	except ImportError:
+		payload = json.dumps(config, indent=1, sort_keys=True).encode()
+
+	with open(tmp_path, "wb") as f:
+		f.write(payload)
+
+	# rename is atomic, so readers never observe a truncated config
+	os.replace(tmp_path, config_path)
 
 
 def update_config(new_config, bench_path="."):
@@ -1,4 +1,5 @@
 # imports - standard imports
+import contextlib
 import json
 import logging
 import os
@@ -25,17 +26,20 @@ logger = logging.getLogger(PROJECT_NAME)
 paths_in_app = ("hooks.py", "modules.txt", "patches.txt")
 paths_in_bench = ("apps", "sites", "config", "logs", "config/pids")
 sudoers_file = "/etc/sudoers.d/frappe"
+bench_cache_file = ".bench.cmd"
 UNSET_ARG = object()
 
 
-def is_bench_directory(directory=os.path.curdir):
-	is_bench = True
+def is_bench_directory(directory: str = os.path.curdir) -> bool:
+	try:
+		entries = {entry.name for entry in os.scandir(directory) if entry.is_dir()}
+	except (FileNotFoundError, NotADirectoryError, PermissionError):
+		return False
 
-	for folder in paths_in_bench:
-		path = os.path.abspath(os.path.join(directory, folder))
-		is_bench = is_bench and os.path.exists(path)
+	if not {"apps", "sites", "config", "logs"}.issubset(entries):
+		return False
 
-	return is_bench
+	return os.path.isdir(os.path.join(directory, "config", "pids"))
 
 
 def is_frappe_app(directory: str) -> bool:
@@ -78,7 +82,7 @@ def is_valid_frappe_branch(frappe_path: str, frappe_branch: str):
 			raise InvalidRemoteException(f"Invalid frappe path: {frappe_path}")
 
 
-def log(message, level=0, no_log=False):
+def log(message: str, level: int = 0, no_log: bool = False) -> None:
 	import bench
 	import bench.cli
 
@@ -104,32 +108,81 @@ def log(message, level=0, no_log=False):
 		click.secho(f"{prefix}: {message}", fg=color)
 
 
+@lru_cache(maxsize=None)
+def get_requests_session():
+	"""Shared Session so repeated HTTP calls reuse pooled TCP/TLS connections"""
+	import requests
+
+	session = requests.Session()
+	adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+	session.mount("https://", adapter)
+	session.mount("http://", adapter)
+	return session
+
+
+def _get_latest_pypi_version() -> str:
+	"""Latest frappe-bench version on PyPI, cached on disk for a day so
+	most bench invocations skip the network round-trip entirely"""
+	from time import time
+
+	cache_file = os.path.join(
+		os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+		"bench",
+		"pypi_version.json",
+	)
+
+	try:
+		with open(cache_file) as f:
+			cached = json.load(f)
+		if time() - cached["ts"] < 86400:
+			return cached["version"]
+	except Exception:
+		pass
+
+	pypi_request = get_requests_session().get(
+		"https://pypi.org/pypi/frappe-bench/json", timeout=2
+	)
+	pypi_request.raise_for_status()
+	version = pypi_request.json().get("info").get("version")
+
+	try:
+		os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+		with open(cache_file, "w") as f:
+			json.dump({"version": version, "ts": time()}, f)
+	except OSError:
+		pass
+
+	return version
+
+
 def check_latest_version():
 	if VERSION.endswith("dev"):
 		return
 
-	import requests
 	from semantic_version import Version
 
 	try:
-		pypi_request = requests.get("https://pypi.org/pypi/frappe-bench/json")
+		pypi_version_str = _get_latest_pypi_version()
 	except Exception:
 		# Exceptions thrown are defined in requests.exceptions
 		# ignore checking on all Exceptions
 		return
 
-	if pypi_request.status_code == 200:
-		pypi_version_str = pypi_request.json().get("info").get("version")
-		pypi_version = Version(pypi_version_str)
-		local_version = Version(VERSION)
+	pypi_version = Version(pypi_version_str)
+	local_version = Version(VERSION)
 
-		if pypi_version > local_version:
-			log(f"A newer version of bench is available: {local_version} → {pypi_version}")
+	if pypi_version > local_version:
+		log(f"A newer version of bench is available: {local_version} → {pypi_version}")
 
 
-def pause_exec(seconds=10):
+def pause_exec(seconds: int = 10) -> None:
 	from time import sleep
 
+	# the countdown only makes sense when someone is watching
+	if not sys.stdout.isatty() or os.environ.get("CI"):
+		sleep(min(seconds, 1))
+		return
+
 	for i in range(seconds, 0, -1):
 		print(f"Will continue execution in {i} seconds...", end="\r")
 		sleep(1)
@@ -137,7 +190,7 @@ def pause_exec(seconds=10):
 	print(" " * 40, end="\r")
 
 
-def exec_cmd(cmd, cwd=".", env=None, _raise=True):
+def exec_cmd(cmd: str, cwd: str = ".", env: dict = None, _raise: bool = True) -> int:
 	if env:
 		env.update(os.environ.copy())
 
@@ -155,7 +208,9 @@ def exec_cmd(cmd, cwd=".", env=None, _raise=True):
 	return return_code
 
 
+@lru_cache(maxsize=None)
 def which(executable: str, raise_err: bool = False) -> str:
+	# cached for the process lifetime; PATH lookups stat every entry
 	from shutil import which
 
 	exec_ = which(executable)
@@ -176,7 +231,7 @@ def setup_logging(bench_path=".") -> logging.Logger:
 
 	logging.Logger.log = logv
 
-	if os.path.exists(os.path.join(bench_path, "logs")):
+	if os.path.isdir(os.path.join(bench_path, "logs")):
 		log_file = os.path.join(bench_path, "logs", "bench.log")
 		hdlr = logging.FileHandler(log_file)
 	else:
@@ -198,6 +253,7 @@ def get_process_manager() -> str:
 			return proc_man_path
 
 
+@lru_cache(maxsize=None)
 def get_git_version() -> float:
 	"""returns git version from `git --version`
 	extracts version number from string `get version 1.9.1` etc"""
@@ -207,11 +263,20 @@ def get_git_version() -> float:
 	return float(version)
 
 
-def get_cmd_output(cmd, cwd=".", _raise=True):
+def get_cmd_output(cmd, cwd: str = ".", _raise: bool = True) -> str:
+	shell = False
+
+	# only pay for a shell when the command actually needs one
+	if isinstance(cmd, str):
+		if any(char in cmd for char in "|&;<>$`\"'\\*?~\n"):
+			shell = True
+		else:
+			cmd = split(cmd)
+
 	output = ""
 	try:
 		output = subprocess.check_output(
-			cmd, cwd=cwd, shell=True, stderr=subprocess.PIPE, encoding="utf-8"
+			cmd, cwd=cwd, shell=shell, stderr=subprocess.PIPE, encoding="utf-8"
 		).strip()
 	except subprocess.CalledProcessError as e:
 		if e.output:
@@ -221,7 +286,7 @@ def get_cmd_output(cmd, cwd=".", _raise=True):
 	return output
 
 
-def is_root():
+def is_root() -> bool:
 	return os.getuid() == 0
 
 
@@ -252,40 +317,48 @@ def run_frappe_cmd(*args, **kwargs):
 
 
 def print_output(p):
-	from select import select
-
-	while p.poll() is None:
-		readx = select([p.stdout.fileno(), p.stderr.fileno()], [], [])[0]
-		send_buffer = []
-		for fd in readx:
-			if fd == p.stdout.fileno():
-				while 1:
-					buf = p.stdout.read(1)
-					if not len(buf):
-						break
-					if buf == "\r" or buf == "\n":
-						send_buffer.append(buf)
-						log_line("".join(send_buffer), "stdout")
-						send_buffer = []
-					else:
-						send_buffer.append(buf)
+	import selectors
+
+	sel = selectors.DefaultSelector()
+	sel.register(p.stdout, selectors.EVENT_READ, "stdout")
+	sel.register(p.stderr, selectors.EVENT_READ, "stderr")
+	buffers = {"stdout": bytearray(), "stderr": bytearray()}
+
+	while sel.get_map():
+		for key, _ in sel.select():
+			data = os.read(key.fd, 65536)
+			if not data:
+				sel.unregister(key.fileobj)
+				continue
 
-			if fd == p.stderr.fileno():
-				log_line(p.stderr.readline(), "stderr")
-	return p.poll()
+			buffer = buffers[key.data]
+			buffer += data
+			# flush complete lines, keep any trailing partial line buffered
+			cut = max(buffer.rfind(b"\n"), buffer.rfind(b"\r")) + 1
+			if cut:
+				log_line(buffer[:cut].decode(errors="replace"), key.data)
+				del buffer[:cut]
 
+	sel.close()
 
-def log_line(data, stream):
+	for stream, buffer in buffers.items():
+		if buffer:
+			log_line(buffer.decode(errors="replace"), stream)
+
+	return p.wait()
+
+
+def log_line(data: str, stream: str) -> int:
 	if stream == "stderr":
 		return sys.stderr.write(data)
 	return sys.stdout.write(data)
 
 
-def get_bench_name(bench_path):
+def get_bench_name(bench_path: str) -> str:
 	return os.path.basename(os.path.abspath(bench_path))
 
 
-def set_git_remote_url(git_url, bench_path="."):
+def set_git_remote_url(git_url: str, bench_path: str = ".") -> None:
 	"Set app remote git url"
 	from bench.app import get_repo_dir
 	from bench.bench import Bench
@@ -338,20 +411,22 @@ def find_benches(directory: str = None) -> List:
 		return
 
 	benches = []
+	stack = [directory]
 
-	try:
-		sub_directories = os.listdir(directory)
-	except PermissionError:
-		return benches
-
-	for sub in sub_directories:
-		sub = os.path.join(directory, sub)
-		if os.path.isdir(sub) and not os.path.islink(sub):
-			if is_bench_directory(sub):
-				print(f"{sub} found!")
-				benches.append(sub)
-			else:
-				benches.extend(find_benches(sub))
+	while stack:
+		current = stack.pop()
+		try:
+			with os.scandir(current) as it:
+				for entry in it:
+					if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+						continue
+					if is_bench_directory(entry.path):
+						print(f"{entry.path} found!")
+						benches.append(entry.path)
+					else:
+						stack.append(entry.path)
+		except PermissionError:
+			continue
 
 	return benches
 
@@ -367,22 +442,22 @@ def is_dist_editable(dist: str) -> bool:
 
 def find_parent_bench(path: str) -> str:
 	"""Checks if parent directories are benches"""
-	if is_bench_directory(directory=path):
-		return path
-
 	home_path = os.path.expanduser("~")
 	root_path = os.path.abspath(os.sep)
 
-	if path not in {home_path, root_path}:
+	while True:
+		if is_bench_directory(directory=path):
+			return path
+
+		if path in {home_path, root_path}:
+			return
+
 		# NOTE: the os.path.split assumes that given path is absolute
-		parent_dir = os.path.split(path)[0]
-		return find_parent_bench(parent_dir)
+		path = os.path.split(path)[0]
 
 
 def get_env_frappe_commands(bench_path=".") -> List:
-	"""Caches all available commands (even custom apps) via Frappe
-	Default caching behaviour: generated the first time any command (for a specific bench directory)
-	"""
+	"""Asks the bench's Frappe for all available commands (even custom apps)"""
 	from bench.utils.bench import get_env_cmd
 
 	python = get_env_cmd("python*", bench_path=bench_path)
@@ -402,6 +477,76 @@ def get_env_frappe_commands(bench_path=".") -> List:
 	return []
 
 
+def _is_command_cache_stale(bench_path: str, cache_file: str) -> bool:
+	"""True if any app's command sources changed after the cache was written"""
+	try:
+		cache_mtime = os.stat(cache_file).st_mtime
+	except OSError:
+		return True
+
+	apps_dir = os.path.join(bench_path, "apps")
+
+	try:
+		# the directory's own mtime changes when apps are added or removed
+		if os.stat(apps_dir).st_mtime > cache_mtime:
+			return True
+		apps = os.scandir(apps_dir)
+	except OSError:
+		return True
+
+	with apps:
+		for app in apps:
+			if not app.is_dir():
+				continue
+			for candidate in (
+				os.path.join(app.path, "setup.py"),
+				os.path.join(app.path, "pyproject.toml"),
+				os.path.join(app.path, app.name, "commands.py"),
+				os.path.join(app.path, app.name, "commands", "__init__.py"),
+			):
+				try:
+					if os.stat(candidate).st_mtime > cache_mtime:
+						return True
+				except OSError:
+					continue
+
+	return False
+
+
+def generate_command_cache(bench_path=".") -> List:
+	"""Caches all available commands (even custom apps) via Frappe
+	Default caching behaviour: generated the first time any command (for a specific bench directory)
+	"""
+	cache_file = os.path.join(bench_path, bench_cache_file)
+
+	if not _is_command_cache_stale(bench_path, cache_file):
+		try:
+			with open(cache_file) as f:
+				return json.load(f)
+		except (OSError, json.JSONDecodeError):
+			pass
+
+	commands = get_env_frappe_commands(bench_path=bench_path)
+
+	if commands:
+		try:
+			with open(cache_file, "w") as f:
+				json.dump(commands, f)
+		except OSError:
+			pass
+
+	return commands
+
+
+def clear_command_cache(bench_path="."):
+	"""Drops the cached frappe commands if the apps' command sources changed"""
+	cache_file = os.path.join(bench_path, bench_cache_file)
+
+	if _is_command_cache_stale(bench_path, cache_file):
+		with contextlib.suppress(FileNotFoundError):
+			os.remove(cache_file)
+
+
 def find_org(org_repo):
 	import requests
 
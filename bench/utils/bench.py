@@ -25,6 +25,16 @@ logger = logging.getLogger(bench.PROJECT_NAME)
 def get_env_cmd(cmd: str, bench_path: str = ".") -> str:
 	# this supports envs' generated by patched virtualenv or venv (which may cause an extra 'local' folder to be created)
 
+	# check the known layouts before falling back to the recursive glob,
+	# which walks the entire env tree including site-packages
+	for pattern in (
+		os.path.join(bench_path, "env", "bin", cmd),
+		os.path.join(bench_path, "env", "local", "bin", cmd),
+	):
+		existing_python_bins = glob(pattern)
+		if existing_python_bins:
+			return os.path.abspath(existing_python_bins[0])
+
 	existing_python_bins = glob(
 		os.path.join(bench_path, "env", "**", "bin", cmd), recursive=True
 	)
@@ -125,7 +135,7 @@ def update_yarn_packages(bench_path=".", apps=None):
 
 	for app in apps:
 		app_path = os.path.join(apps_dir, app)
-		if os.path.exists(os.path.join(app_path, "package.json")):
+		if os.path.isfile(os.path.join(app_path, "package.json")):
 			click.secho(f"\nInstalling node dependencies for {app}", fg="yellow")
 			bench.run("yarn install", cwd=app_path)
 
@@ -135,32 +145,39 @@ def update_npm_packages(bench_path=".", apps=None):
 	package_json = {}
 
 	if not apps:
-		apps = os.listdir(apps_dir)
+		with os.scandir(apps_dir) as it:
+			apps = [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
 
 	for app in apps:
 		package_json_path = os.path.join(apps_dir, app, "package.json")
 
-		if os.path.exists(package_json_path):
+		try:
 			with open(package_json_path) as f:
-				app_package_json = json.loads(f.read())
-				# package.json is usually a dict in a dict
-				for key, value in app_package_json.items():
-					if key not in package_json:
-						package_json[key] = value
-					else:
-						if isinstance(value, dict):
-							package_json[key].update(value)
-						elif isinstance(value, list):
-							package_json[key].extend(value)
-						else:
-							package_json[key] = value
-
-	if package_json is {}:
-		with open(os.path.join(os.path.dirname(__file__), "package.json")) as f:
-			package_json = json.loads(f.read())
+				app_package_json = json.load(f)
+		except FileNotFoundError:
+			continue
+
+		# package.json is usually a dict in a dict
+		for key, value in app_package_json.items():
+			if key not in package_json:
+				package_json[key] = value
+			elif isinstance(value, dict):
+				package_json[key].update(value)
+			elif isinstance(value, list):
+				package_json[key].extend(value)
+			else:
+				package_json[key] = value
+
+	if not package_json:
+		try:
+			with open(os.path.join(os.path.dirname(__file__), "package.json")) as f:
+				package_json = json.load(f)
+		except FileNotFoundError:
+			# no bundled default is shipped; keep the empty merge result
+			package_json = {}
 
 	with open(os.path.join(bench_path, "package.json"), "w") as f:
-		f.write(json.dumps(package_json, indent=1, sort_keys=True))
+		json.dump(package_json, f, indent=1, sort_keys=True)
 
 	exec_cmd("npm install", cwd=bench_path)
 
@@ -458,44 +475,84 @@ def update(
 	)
 
 
+# ioctl to clone a file's extents on reflink capable filesystems (btrfs/XFS)
+FICLONE = 0x40049409
+
+
+def _reflink_or_copy(src, dst, *, follow_symlinks=True):
+	"""copy_function for shutil.copytree: reflink (CoW) when the
+	filesystem supports it, else a regular shutil.copy2"""
+	import fcntl
+	import shutil
+
+	try:
+		with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+			fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+		shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+	except OSError:
+		shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _copytree_into(src, dst):
+	"""Merge src into a possibly existing dst directory
+	(copytree's dirs_exist_ok needs Python 3.8, we still support 3.7)"""
+	import shutil
+
+	os.makedirs(dst, exist_ok=True)
+
+	with os.scandir(src) as it:
+		for entry in it:
+			target = os.path.join(dst, entry.name)
+			if entry.is_symlink():
+				os.symlink(os.readlink(entry.path), target)
+			elif entry.is_dir():
+				shutil.copytree(
+					entry.path, target, symlinks=True, copy_function=_reflink_or_copy
+				)
+			else:
+				_reflink_or_copy(entry.path, target)
+
+
 def clone_apps_from(bench_path, clone_from, update_app=True):
 	from bench.app import install_app
 
 	print(f"Copying apps from {clone_from}...")
-	subprocess.check_output(["cp", "-R", os.path.join(clone_from, "apps"), bench_path])
+	_copytree_into(os.path.join(clone_from, "apps"), os.path.join(bench_path, "apps"))
 
 	node_modules_path = os.path.join(clone_from, "node_modules")
 	if os.path.exists(node_modules_path):
 		print(f"Copying node_modules from {clone_from}...")
-		subprocess.check_output(["cp", "-R", node_modules_path, bench_path])
+		_copytree_into(node_modules_path, os.path.join(bench_path, "node_modules"))
 
-	def setup_app(app):
-		# run git reset --hard in each branch, pull latest updates and install_app
+	def cleanup_app(app):
+		# run git reset --hard in each branch and pull latest updates
 		app_path = os.path.join(bench_path, "apps", app)
 
-		# remove .egg-ino
-		subprocess.check_output(["rm", "-rf", app + ".egg-info"], cwd=app_path)
+		# batch the cleanup into one shell invocation instead of five subprocesses
+		commands = [f"rm -rf {app}.egg-info"]
 
 		if update_app and os.path.exists(os.path.join(app_path, ".git")):
-			remotes = subprocess.check_output(["git", "remote"], cwd=app_path).strip().split()
-			if "upstream" in remotes:
-				remote = "upstream"
-			else:
-				remote = remotes[0]
 			print(f"Cleaning up {app}")
-			branch = subprocess.check_output(
-				["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=app_path
-			).strip()
-			subprocess.check_output(["git", "reset", "--hard"], cwd=app_path)
-			subprocess.check_output(["git", "pull", "--rebase", remote, branch], cwd=app_path)
+			commands += [
+				"git reset --hard",
+				'git pull --rebase "$(git remote | grep -qx upstream && echo upstream'
+				' || git remote | head -1)" "$(git rev-parse --abbrev-ref HEAD)"',
+			]
 
-		install_app(app, bench_path, restart_bench=False)
+		subprocess.check_output(" && ".join(commands), shell=True, cwd=app_path)
 
 	with open(os.path.join(clone_from, "sites", "apps.txt")) as f:
 		apps = f.read().splitlines()
 
+	if apps:
+		# only the git cleanup is safe to thread; installs below share one env
+		from concurrent.futures import ThreadPoolExecutor
+
+		with ThreadPoolExecutor(max_workers=min(8, len(apps))) as executor:
+			list(executor.map(cleanup_app, apps))
+
 	for app in apps:
-		setup_app(app)
+		install_app(app, bench_path, restart_bench=False)
 
 
 def remove_backups_crontab(bench_path="."):
@@ -532,18 +589,9 @@ def set_redis_socketio_host(host, bench_path="."):
 
 
 def update_common_site_config(ddict, bench_path="."):
-	filename = os.path.join(bench_path, "sites", "common_site_config.json")
-
-	if os.path.exists(filename):
-		with open(filename) as f:
-			content = json.load(f)
-
-	else:
-		content = {}
+	from bench.config.common_site_config import update_config
 
-	content.update(ddict)
-	with open(filename, "w") as f:
-		json.dump(content, f, indent=1, sort_keys=True)
+	update_config(ddict, bench_path=bench_path)
 
 
 def validate_app_installed_on_sites(app, bench_path="."):
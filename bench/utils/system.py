@@ -110,8 +110,8 @@ def init(
 def setup_sudoers(user):
 	from bench.config.lets_encrypt import get_certbot_path
 
-	if not os.path.exists("/etc/sudoers.d"):
-		os.makedirs("/etc/sudoers.d")
+	if not os.path.isdir("/etc/sudoers.d"):
+		os.makedirs("/etc/sudoers.d", exist_ok=True)
 
 		set_permissions = not os.path.exists("/etc/sudoers")
 		with open("/etc/sudoers", "a") as f:
@@ -169,14 +169,20 @@ def backup_site(site, bench_path="."):
 
 
 def backup_all_sites(bench_path="."):
+	from concurrent.futures import ThreadPoolExecutor
+
 	from bench.bench import Bench
 
-	for site in Bench(bench_path).sites:
-		backup_site(site, bench_path=bench_path)
+	sites = Bench(bench_path).sites
+	if not sites:
+		return
+
+	# cap concurrency so parallel dumps don't saturate the database
+	with ThreadPoolExecutor(max_workers=min(4, len(sites))) as executor:
+		list(executor.map(lambda site: backup_site(site, bench_path=bench_path), sites))
 
 
 def fix_prod_setup_perms(bench_path=".", frappe_user=None):
-	from glob import glob
 	from bench.bench import Bench
 
 	frappe_user = frappe_user or Bench(bench_path).conf.get("frappe_user")
@@ -185,12 +191,17 @@ def fix_prod_setup_perms(bench_path=".", frappe_user=None):
 		print("frappe user not set")
 		sys.exit(1)
 
-	globs = ["logs/*", "config/*"]
-	for glob_name in globs:
-		for path in glob(glob_name):
-			uid = pwd.getpwnam(frappe_user).pw_uid
-			gid = grp.getgrnam(frappe_user).gr_gid
-			os.chown(path, uid, gid)
+	# resolve uid/gid once instead of once per file
+	uid = pwd.getpwnam(frappe_user).pw_uid
+	gid = grp.getgrnam(frappe_user).gr_gid
+
+	for folder in ("logs", "config"):
+		try:
+			with os.scandir(folder) as it:
+				for entry in it:
+					os.chown(entry.path, uid, gid)
+		except FileNotFoundError:
+			continue
 
 
 def setup_fonts():
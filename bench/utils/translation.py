@@ -14,15 +14,15 @@ def update_translations_p(args):
 
 
 def download_translations_p():
-	import multiprocessing
-
-	pool = multiprocessing.Pool(multiprocessing.cpu_count())
+	# downloads are pure HTTP I/O, so threads beat forked workers here
+	from concurrent.futures import ThreadPoolExecutor
 
 	langs = get_langs()
 	apps = ("frappe", "erpnext")
 	args = list(itertools.product(apps, langs))
 
-	pool.map(update_translations_p, args)
+	with ThreadPoolExecutor(max_workers=32) as executor:
+		list(executor.map(update_translations_p, args))
 
 
 def download_translations():
@@ -40,19 +40,18 @@ def get_langs():
 
 
 def update_translations(app, lang):
-	import requests
+	from bench.utils import get_requests_session
 
 	translations_dir = os.path.join("apps", app, app, "translations")
 	csv_file = os.path.join(translations_dir, f"{lang}.csv")
 	url = f"https://translate.erpnext.com/files/{app}-{lang}.csv"
-	r = requests.get(url, stream=True)
+	r = get_requests_session().get(url, stream=True, timeout=30)
 	r.raise_for_status()
 
 	with open(csv_file, "wb") as f:
-		for chunk in r.iter_content(chunk_size=1024):
+		for chunk in r.iter_content(chunk_size=64 * 1024):
 			# filter out keep-alive new chunks
 			if chunk:
 				f.write(chunk)
-				f.flush()
 
 	print("downloaded for", app, lang)